@@ -2,21 +2,26 @@
 """Benchmark script comparing Moonshine vs Whisper API transcription speed.
 
 Usage:
-    python scripts/benchmark.py [--audio-file PATH] [--duration SECONDS]
+    python scripts/benchmark.py [--audio-file PATH [PATH ...]] [--duration SECONDS]
 
-This script generates test audio (or uses a provided file) and measures
-transcription time for each available engine.
+This script generates test audio (or uses the provided files, concatenated)
+and measures transcription time for each available engine.
 
 Requirements:
     - Moonshine: pip install useful-moonshine-onnx
     - Whisper API: pip install openai + set OPENAI_API_KEY env var
+    - Optional: pip install numba (faster loading of long WAV files)
 """
 
 import argparse
+import asyncio
+import io
 import os
 import sys
 import time
+import wave
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 
@@ -24,7 +29,20 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from claude_stt.engines.moonshine import MoonshineEngine
-from claude_stt.engines.whisper_api import WhisperAPIEngine
+from claude_stt.engines.whisper_api import AudioUpload, WhisperAPIEngine
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _pcm16_to_float32(src, dst):
+        """Scale int16 samples into a float32 buffer in a single pass."""
+        for i in prange(src.shape[0]):
+            dst[i] = src[i] * (1.0 / 32768.0)
 
 
 def generate_test_audio(duration_seconds: float = 5.0, sample_rate: int = 16000) -> np.ndarray:
@@ -34,35 +52,127 @@ def generate_test_audio(duration_seconds: float = 5.0, sample_rate: int = 16000)
     """
     samples = int(duration_seconds * sample_rate)
     # Generate white noise as placeholder audio
-    audio = np.random.randn(samples).astype(np.float32) * 0.1
+    rng = np.random.default_rng()
+    audio = rng.standard_normal(samples, dtype=np.float32)
+    audio *= 0.1
+    return audio
+
+
+def _read_wav_frames(wav_file: wave.Wave_read, sample_rate: int) -> bytes:
+    assert wav_file.getnchannels() == 1, "Audio must be mono"
+    assert wav_file.getframerate() == sample_rate, f"Sample rate must be {sample_rate}"
+    return wav_file.readframes(wav_file.getnframes())
+
+
+def _decode_pcm16(frames: bytes) -> np.ndarray:
+    raw = np.frombuffer(frames, dtype=np.int16)
+    audio = np.empty(raw.shape[0], dtype=np.float32)
+    if njit is None:
+        np.multiply(raw, np.float32(1 / 32768.0), out=audio)
+    else:
+        _pcm16_to_float32(raw, audio)
     return audio
 
 
 def load_audio_file(path: str, sample_rate: int = 16000) -> np.ndarray:
     """Load audio from a WAV file."""
-    import wave
-
     with wave.open(path, "rb") as wav_file:
-        assert wav_file.getnchannels() == 1, "Audio must be mono"
-        assert wav_file.getframerate() == sample_rate, f"Sample rate must be {sample_rate}"
+        frames = _read_wav_frames(wav_file, sample_rate)
 
-        frames = wav_file.readframes(wav_file.getnframes())
-        audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    return _decode_pcm16(frames)
+
+
+async def load_audio_file_async(path: str, sample_rate: int = 16000) -> np.ndarray:
+    """Load audio from a WAV file without blocking the event loop.
+
+    The file is read in a worker thread and the WAV container is parsed from
+    memory once the read completes.
+    """
+    data = await asyncio.to_thread(Path(path).read_bytes)
+
+    with wave.open(io.BytesIO(data), "rb") as wav_file:
+        frames = _read_wav_frames(wav_file, sample_rate)
+
+    return _decode_pcm16(frames)
+
+
+async def load_audio_files(paths: list[str], sample_rate: int = 16000) -> np.ndarray:
+    """Load several WAV files concurrently and concatenate them in order."""
+    clips = await asyncio.gather(*(load_audio_file_async(p, sample_rate) for p in paths))
+    return np.concatenate(clips)
+
+
+def _timed_transcribe(engine, audio: np.ndarray, sample_rate: int) -> tuple[float, str]:
+    start = time.perf_counter()
+    text = engine.transcribe(audio, sample_rate)
+    return time.perf_counter() - start, text
 
-    return audio
 
+async def _timed_transcribe_bytes_async(
+    engine: WhisperAPIEngine, upload: AudioUpload
+) -> Optional[tuple[float, str]]:
+    """Time one request, returning None if the request itself failed.
 
-def benchmark_engine(engine, audio: np.ndarray, sample_rate: int, runs: int = 3) -> dict:
+    An empty transcript is a valid result (e.g. for silence or noise), so
+    failures are detected from the request error rather than the text.
+    """
+    start = time.perf_counter()
+    try:
+        text = await engine.transcribe_bytes_async(upload, raise_errors=True)
+    except Exception as exc:
+        print(f"  Request failed: {exc}")
+        return None
+    return time.perf_counter() - start, text
+
+
+async def _transcribe_concurrently(
+    engine: WhisperAPIEngine, upload: AudioUpload, runs: int, concurrency: int
+) -> tuple[float, list[Optional[tuple[float, str]]]]:
+    """Run the transcriptions with at most ``concurrency`` requests in flight.
+
+    Returns:
+        The batch wall time and a (latency, text) pair per run, or None for
+        runs whose request failed.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one() -> Optional[tuple[float, str]]:
+        async with semaphore:
+            return await _timed_transcribe_bytes_async(engine, upload)
+
+    start = time.perf_counter()
+    try:
+        timings = await asyncio.gather(*(run_one() for _ in range(runs)))
+    finally:
+        await engine.aclose()
+    return time.perf_counter() - start, timings
+
+
+def benchmark_engine(
+    engine, audio: np.ndarray, sample_rate: int, runs: int = 3, concurrency: int = 4
+) -> dict:
     """Benchmark an engine with multiple runs.
 
+    Whisper API runs are issued with up to ``concurrency`` requests in flight;
+    runs whose request raises (e.g. rate limited) are counted in
+    'failed_runs' and left out of the timings.
+
     Returns:
-        dict with 'available', 'load_time', 'transcribe_times', 'avg_time', 'result'
+        dict with 'available', 'load_time', 'encode_time' (Whisper API only),
+        'concurrency', 'batch_time', 'failed_runs', 'transcribe_times',
+        'avg_time', 'p50', 'p95', 'result'
     """
     result = {
         "available": False,
         "load_time": None,
+        "encode_time": None,
+        "concurrency": 1,
+        "batch_time": None,
+        "failed_runs": 0,
         "transcribe_times": [],
         "avg_time": None,
+        "p50": None,
+        "p95": None,
         "result": None,
         "error": None,
     }
@@ -80,16 +190,39 @@ def benchmark_engine(engine, audio: np.ndarray, sample_rate: int, runs: int = 3)
         return result
     result["load_time"] = time.perf_counter() - start
 
-    # Benchmark transcription (multiple runs)
-    for _ in range(runs):
+    # Benchmark transcription (multiple runs). API calls are network-bound,
+    # so overlap a bounded number of them; local engines run back to back.
+    # The upload payload is identical across runs, so encode it once up front.
+    if isinstance(engine, WhisperAPIEngine):
+        start = time.perf_counter()
+        upload = engine.encode_audio(audio, sample_rate)
+        result["encode_time"] = time.perf_counter() - start
+        result["concurrency"] = max(1, min(concurrency, runs))
+        batch_time, timings = asyncio.run(
+            _transcribe_concurrently(engine, upload, runs, result["concurrency"])
+        )
+        result["batch_time"] = batch_time
+        succeeded = [timing for timing in timings if timing is not None]
+        result["failed_runs"] = len(timings) - len(succeeded)
+        timings = succeeded
+    else:
         start = time.perf_counter()
-        text = engine.transcribe(audio, sample_rate)
-        elapsed = time.perf_counter() - start
+        timings = [_timed_transcribe(engine, audio, sample_rate) for _ in range(runs)]
+        result["batch_time"] = time.perf_counter() - start
+
+    if not timings:
+        result["error"] = "All transcription runs failed"
+        return result
+
+    for elapsed, text in timings:
         result["transcribe_times"].append(elapsed)
         if result["result"] is None:
             result["result"] = text
 
-    result["avg_time"] = sum(result["transcribe_times"]) / len(result["transcribe_times"])
+    times = np.asarray(result["transcribe_times"])
+    result["avg_time"] = float(times.mean())
+    result["p50"] = float(np.median(times))
+    result["p95"] = float(np.quantile(times, 0.95))
     return result
 
 
@@ -110,8 +243,20 @@ def print_results(name: str, results: dict, audio_duration: float):
 
     print(f"  Status: Available")
     print(f"  Model load time: {results['load_time']:.3f}s")
+    if results["encode_time"] is not None:
+        print(f"  Audio encode time: {results['encode_time'] * 1000:.1f}ms (once, before runs)")
+    if results["failed_runs"]:
+        print(f"  Failed runs (excluded): {results['failed_runs']}")
     print(f"  Transcription times: {[f'{t:.3f}s' for t in results['transcribe_times']]}")
     print(f"  Average time: {results['avg_time']:.3f}s")
+    print(f"  p50 / p95: {results['p50']:.3f}s / {results['p95']:.3f}s")
+    if results["concurrency"] > 1:
+        print(
+            f"  Batch wall time: {results['batch_time']:.3f}s "
+            f"({results['concurrency']} concurrent; latencies include contention)"
+        )
+    else:
+        print(f"  Batch wall time: {results['batch_time']:.3f}s (sequential)")
     print(f"  Audio duration: {audio_duration:.1f}s")
     print(f"  Real-time factor: {results['avg_time'] / audio_duration:.2f}x")
     print(f"  Result preview: {(results['result'] or '')[:100]!r}")
@@ -121,7 +266,9 @@ def main():
     parser = argparse.ArgumentParser(description="Benchmark STT engines")
     parser.add_argument(
         "--audio-file",
-        help="Path to WAV file (16kHz mono) to use for benchmarking",
+        nargs="+",
+        help="Path(s) to WAV files (16kHz mono) to use for benchmarking; "
+        "multiple files are read concurrently and concatenated",
     )
     parser.add_argument(
         "--duration",
@@ -129,6 +276,12 @@ def main():
         default=5.0,
         help="Duration in seconds for generated test audio (default: 5.0)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent Whisper API requests (default: 4)",
+    )
     parser.add_argument(
         "--runs",
         type=int,
@@ -142,8 +295,11 @@ def main():
 
     # Prepare audio
     if args.audio_file:
-        print(f"Loading audio from: {args.audio_file}")
-        audio = load_audio_file(args.audio_file)
+        print(f"Loading audio from: {', '.join(args.audio_file)}")
+        if len(args.audio_file) == 1:
+            audio = load_audio_file(args.audio_file[0])
+        else:
+            audio = asyncio.run(load_audio_files(args.audio_file))
         audio_duration = len(audio) / 16000
     else:
         print(f"Generating {args.duration}s of test audio (white noise)")
@@ -153,6 +309,7 @@ def main():
 
     print(f"Audio duration: {audio_duration:.1f}s")
     print(f"Runs per engine: {args.runs}")
+    print(f"Whisper API concurrency: {args.concurrency}")
 
     # Initialize engines
     engines = {
@@ -168,7 +325,7 @@ def main():
     results = {}
     for name, engine in engines.items():
         print(f"\nBenchmarking {name}...")
-        results[name] = benchmark_engine(engine, audio, 16000, args.runs)
+        results[name] = benchmark_engine(engine, audio, 16000, args.runs, args.concurrency)
         print_results(name, results[name], audio_duration)
 
     # Summary comparison
@@ -188,7 +345,8 @@ def main():
         print("\nSpeed comparison:")
         for name, r in sorted_engines:
             relative = r["avg_time"] / fastest_results["avg_time"]
-            print(f"  {name}: {relative:.2f}x (avg {r['avg_time']:.3f}s)")
+            mode = f", {r['concurrency']} concurrent" if r["concurrency"] > 1 else ""
+            print(f"  {name}: {relative:.2f}x (avg {r['avg_time']:.3f}s{mode})")
     elif len(available_engines) == 1:
         name, r = available_engines[0]
         print(f"\nOnly one engine available: {name}")
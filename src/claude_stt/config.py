@@ -4,7 +4,8 @@ import logging
 import os
 import platform
 import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -24,6 +25,18 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    # Resolved on first use rather than at import, so an unresolvable home
+    # directory only matters when no CLAUDE_STT_CONFIG_DIR override is set.
+    return Path.home() / ".claude" / "plugins" / "claude-stt"
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    return _default_config_dir() / "config.toml"
+
+
 @dataclass
 class Config:
     """claude-stt configuration."""
@@ -54,7 +67,7 @@ class Config:
         override = os.environ.get("CLAUDE_STT_CONFIG_DIR")
         if override:
             return Path(override).expanduser()
-        return Path.home() / ".claude" / "plugins" / "claude-stt"
+        return _default_config_dir()
 
     @classmethod
     def _legacy_config_path(cls) -> Path | None:
@@ -67,7 +80,9 @@ class Config:
     @classmethod
     def get_config_path(cls) -> Path:
         """Get the configuration file path."""
-        return cls.get_config_dir() / "config.toml"
+        if os.environ.get("CLAUDE_STT_CONFIG_DIR"):
+            return cls.get_config_dir() / "config.toml"
+        return _default_config_path()
 
     @classmethod
     def load(cls) -> "Config":
@@ -90,20 +105,7 @@ class Config:
 
             stt_config = data.get("claude-stt", {})
             config = cls(
-                hotkey=stt_config.get("hotkey", cls.hotkey),
-                mode=stt_config.get("mode", cls.mode),
-                engine=stt_config.get("engine", cls.engine),
-                moonshine_model=stt_config.get("moonshine_model", cls.moonshine_model),
-                whisper_model=stt_config.get("whisper_model", cls.whisper_model),
-                whisper_api_language=stt_config.get(
-                    "whisper_api_language", cls.whisper_api_language
-                ),
-                sample_rate=stt_config.get("sample_rate", cls.sample_rate),
-                max_recording_seconds=stt_config.get(
-                    "max_recording_seconds", cls.max_recording_seconds
-                ),
-                output_mode=stt_config.get("output_mode", cls.output_mode),
-                sound_effects=stt_config.get("sound_effects", cls.sound_effects),
+                **{f.name: stt_config.get(f.name, f.default) for f in fields(cls)}
             )
             config = config.validate()
             if legacy_path and tomli_w is not None:
@@ -129,20 +131,7 @@ class Config:
         config_path = self.get_config_path()
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "claude-stt": {
-                "hotkey": self.hotkey,
-                "mode": self.mode,
-                "engine": self.engine,
-                "moonshine_model": self.moonshine_model,
-                "whisper_model": self.whisper_model,
-                "whisper_api_language": self.whisper_api_language,
-                "sample_rate": self.sample_rate,
-                "max_recording_seconds": self.max_recording_seconds,
-                "output_mode": self.output_mode,
-                "sound_effects": self.sound_effects,
-            }
-        }
+        data = {"claude-stt": {f.name: getattr(self, f.name) for f in fields(self)}}
 
         temp_file = None
         try:
@@ -229,6 +218,7 @@ class Config:
         return self
 
 
+@lru_cache(maxsize=1)
 def get_platform() -> str:
     """Get the current platform identifier."""
     system = platform.system()
@@ -241,6 +231,7 @@ def get_platform() -> str:
     return "unknown"
 
 
+@lru_cache(maxsize=1)
 def is_wayland() -> bool:
     """Check if running under Wayland on Linux."""
     if get_platform() != "linux":
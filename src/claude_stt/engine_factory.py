@@ -2,19 +2,26 @@
 
 from .config import Config
 from .engines import STTEngine
-from .engines.moonshine import MoonshineEngine
-from .engines.whisper import WhisperEngine
-from .engines.whisper_api import WhisperAPIEngine
 from .errors import EngineError
 
 
 def build_engine(config: Config) -> STTEngine:
-    """Create an engine instance for the configured engine."""
+    """Create an engine instance for the configured engine.
+
+    Engine modules are imported here rather than at module scope so only the
+    configured engine's backend (onnxruntime, faster-whisper, openai) is loaded.
+    """
     if config.engine == "moonshine":
+        from .engines.moonshine import MoonshineEngine
+
         return MoonshineEngine(model_name=config.moonshine_model)
     if config.engine == "whisper":
+        from .engines.whisper import WhisperEngine
+
         return WhisperEngine(model_name=config.whisper_model)
     if config.engine == "whisper-api":
+        from .engines.whisper_api import WhisperAPIEngine
+
         language = config.whisper_api_language or None
         return WhisperAPIEngine(language=language)
     raise EngineError(f"Unknown engine '{config.engine}'")
@@ -2,23 +2,129 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import io
 import logging
 import os
-import wave
+import struct
 from typing import Optional
 
 import numpy as np
 
-_openai_available = False
+# The OpenAI SDK is slow to import, so only check that it is installed here
+# and defer the import until an engine actually needs a client.
+_openai_available = importlib.util.find_spec("openai") is not None
 _OpenAI = None
+_AsyncOpenAI = None
 
-try:
-    from openai import OpenAI as _OpenAI
+# soundfile loads cffi and libsndfile on import, so defer it the same way.
+_soundfile_available = importlib.util.find_spec("soundfile") is not None
+_sf = None
 
-    _openai_available = True
-except ImportError:
-    pass
+# Encoded upload as passed to the SDK: (filename, file contents, MIME type).
+AudioUpload = tuple[str, bytes, str]
+
+# OpenAI clients keyed by API key, shared across engine instances so the
+# SDK's HTTP connection pool survives engine rebuilds.
+_client_cache: dict[str, object] = {}
+
+# Samples converted per block in _to_pcm16 (256 KB of float32 scratch).
+_PCM_BLOCK_SAMPLES = 1 << 16
+
+# RIFF header for a canonical 44-byte mono 16-bit PCM WAV file.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _to_pcm16(audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert audio to 16-bit PCM samples.
+
+    Float samples are scaled by 32768, rounded to nearest and clipped to the
+    int16 range, matching libsndfile's own float conversion. The work is done in cache-sized blocks, so only a small float32
+    temporary is allocated. Pass ``out`` to reuse an existing int16 buffer
+    of the same shape.
+    """
+    if audio.dtype.kind != "f":
+        return audio.astype(np.int16, copy=False)
+    if out is None:
+        out = np.empty(audio.shape, dtype=np.int16)
+
+    src = audio.reshape(-1)
+    dst = out.reshape(-1)
+    block = np.empty(min(_PCM_BLOCK_SAMPLES, src.size), dtype=np.float32)
+    for start in range(0, src.size, _PCM_BLOCK_SAMPLES):
+        chunk = src[start : start + _PCM_BLOCK_SAMPLES]
+        scaled = block[: chunk.size]
+        np.multiply(chunk, np.float32(32768), out=scaled, casting="unsafe")
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        dst[start : start + chunk.size] = scaled
+    return out
+
+
+def _wav_bytes(pcm: np.ndarray, sample_rate: int) -> bytes:
+    """Wrap int16 mono samples in a WAV container.
+
+    The samples are copied exactly once, straight into the returned bytes.
+    """
+    pcm = np.ascontiguousarray(pcm, dtype="<i2")
+    nbytes = pcm.nbytes
+    header = _WAV_HEADER.pack(
+        b"RIFF",
+        36 + nbytes,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        1,  # mono
+        sample_rate,
+        sample_rate * 2,  # byte rate
+        2,  # block align
+        16,  # bits per sample
+        b"data",
+        nbytes,
+    )
+    return b"".join((header, memoryview(pcm).cast("B")))
+
+
+def _load_openai() -> bool:
+    """Import the OpenAI SDK on first use.
+
+    Returns:
+        True if the SDK client classes are available.
+    """
+    global _openai_available, _OpenAI, _AsyncOpenAI
+    if _OpenAI is not None:
+        return True
+    if not _openai_available:
+        return False
+    try:
+        from openai import AsyncOpenAI, OpenAI
+    except ImportError:
+        _openai_available = False
+        return False
+    _OpenAI, _AsyncOpenAI = OpenAI, AsyncOpenAI
+    return True
+
+
+def _load_soundfile() -> bool:
+    """Import soundfile on first use.
+
+    Returns:
+        True if soundfile and its libsndfile library are available.
+    """
+    global _soundfile_available, _sf
+    if _sf is not None:
+        return True
+    if not _soundfile_available:
+        return False
+    try:
+        import soundfile
+    except (ImportError, OSError):
+        _soundfile_available = False
+        return False
+    _sf = soundfile
+    return True
 
 
 class WhisperAPIEngine:
@@ -36,6 +142,7 @@ class WhisperAPIEngine:
         api_key: Optional[str] = None,
         model: str = "whisper-1",
         language: Optional[str] = None,
+        compress: bool = True,
     ):
         """Initialize the OpenAI Whisper API engine.
 
@@ -43,11 +150,16 @@ class WhisperAPIEngine:
             api_key: OpenAI API key. If not provided, uses OPENAI_API_KEY env var.
             model: Model to use (currently only "whisper-1" is available).
             language: Optional language code (e.g., "en", "es"). Auto-detected if not set.
+            compress: Upload FLAC instead of WAV when soundfile is installed.
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.model = model
         self.language = language
+        self.compress = compress
         self._client: Optional[object] = None
+        self._aclient: Optional[object] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pcm_scratch: Optional[np.ndarray] = None
         self._logger = logging.getLogger(__name__)
 
     def is_available(self) -> bool:
@@ -70,13 +182,59 @@ class WhisperAPIEngine:
         if self._client is not None:
             return True
 
+        if not _load_openai():
+            self._logger.warning("openai package could not be imported")
+            return False
+
         try:
-            self._client = _OpenAI(api_key=self.api_key)
+            client = _client_cache.get(self.api_key)
+            if client is None:
+                client = _client_cache.setdefault(self.api_key, _OpenAI(api_key=self.api_key))
+            self._client = client
             return True
         except Exception:
             self._logger.exception("Failed to initialize OpenAI client")
             return False
 
+    def encode_audio(self, audio: np.ndarray, sample_rate: int = 16000) -> AudioUpload:
+        """Encode audio into the payload uploaded to the API.
+
+        Callers sending the same audio several times can encode it once and
+        pass the result to transcribe_bytes().
+
+        Args:
+            audio: Audio data as numpy array (float32, mono).
+            sample_rate: Sample rate of the audio.
+
+        Returns:
+            (filename, contents, MIME type) for a FLAC file when soundfile is
+            installed and the audio is floating point, otherwise for a WAV file.
+        """
+        out = self._pcm_buffer(audio) if audio.dtype.kind == "f" else None
+        pcm = _to_pcm16(audio, out=out)
+
+        if self.compress and audio.dtype.kind == "f" and _load_soundfile():
+            # FLAC is lossless, and both formats are written from the same
+            # int16 samples, so compression doesn't change what the model hears.
+            try:
+                buffer = io.BytesIO()
+                _sf.write(buffer, pcm, sample_rate, format="FLAC", subtype="PCM_16")
+                return ("audio.flac", buffer.getvalue(), "audio/flac")
+            except Exception:
+                self._logger.debug("FLAC encoding failed; falling back to WAV", exc_info=True)
+        return ("audio.wav", _wav_bytes(pcm, sample_rate), "audio/wav")
+
+    def _pcm_buffer(self, audio: np.ndarray) -> np.ndarray:
+        """Return an int16 scratch view shaped like ``audio``.
+
+        The buffer grows to the longest recording seen and is reused after
+        that, for both the FLAC and WAV encoders. Reuse is safe because both
+        copy the samples into the payload before encode_audio returns.
+        """
+        if self._pcm_scratch is None or self._pcm_scratch.shape[0] < audio.size:
+            self._pcm_scratch = np.empty(audio.size, dtype=np.int16)
+        return self._pcm_scratch[: audio.size].reshape(audio.shape)
+
     def transcribe(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
         """Transcribe audio using the OpenAI Whisper API.
 
@@ -91,31 +249,98 @@ class WhisperAPIEngine:
             return ""
 
         try:
-            # Convert float32 audio to int16 WAV format for API
-            if audio.dtype == np.float32:
-                audio_int16 = (audio * 32767).astype(np.int16)
-            else:
-                audio_int16 = audio.astype(np.int16)
-
-            # Create in-memory WAV file
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, "wb") as wav_file:
-                wav_file.setnchannels(1)
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_int16.tobytes())
-
-            wav_buffer.seek(0)
-            wav_buffer.name = "audio.wav"
-
-            # Call OpenAI API
-            kwargs = {"model": self.model, "file": wav_buffer}
-            if self.language:
-                kwargs["language"] = self.language
-
-            response = self._client.audio.transcriptions.create(**kwargs)
+            upload = self.encode_audio(audio, sample_rate)
+        except Exception:
+            self._logger.exception("Failed to encode audio for OpenAI Whisper API")
+            return ""
+        return self.transcribe_bytes(upload)
+
+    async def transcribe_async(self, audio: np.ndarray, sample_rate: int = 16000) -> str:
+        """Transcribe audio using the OpenAI Whisper API without blocking.
+
+        Args:
+            audio: Audio data as numpy array (float32, mono).
+            sample_rate: Sample rate of the audio.
+
+        Returns:
+            Transcribed text, or empty string if transcription fails.
+        """
+        if not self.load_model():
+            return ""
+
+        try:
+            upload = self.encode_audio(audio, sample_rate)
+        except Exception:
+            self._logger.exception("Failed to encode audio for OpenAI Whisper API")
+            return ""
+        return await self.transcribe_bytes_async(upload)
+
+    def transcribe_bytes(self, upload: AudioUpload) -> str:
+        """Transcribe an audio payload produced by encode_audio().
+
+        Args:
+            upload: (filename, contents, MIME type) of the encoded audio.
+
+        Returns:
+            Transcribed text, or empty string if transcription fails.
+        """
+        if not self.load_model():
+            return ""
+
+        try:
+            response = self._client.audio.transcriptions.create(**self._request_kwargs(upload))
+            return response.text.strip()
+
+        except Exception:
+            self._logger.exception("OpenAI Whisper API transcription failed")
+            return ""
+
+    async def transcribe_bytes_async(
+        self, upload: AudioUpload, raise_errors: bool = False
+    ) -> str:
+        """Transcribe an audio payload produced by encode_audio() without blocking.
+
+        Lets callers overlap several requests on one event loop. The async
+        client's connection pool is bound to the loop it was created on, so a
+        new client is created whenever this runs on a different loop. Call
+        aclose() before the loop ends to release its connections.
+
+        Args:
+            upload: (filename, contents, MIME type) of the encoded audio.
+            raise_errors: Re-raise request errors instead of returning an empty
+                string, so callers can tell a failed request from silence.
+
+        Returns:
+            Transcribed text, or empty string if transcription fails.
+        """
+        if not self.load_model():
+            return ""
+
+        try:
+            loop = asyncio.get_running_loop()
+            if self._aclient is None or self._aclient_loop is not loop:
+                self._aclient = _AsyncOpenAI(api_key=self.api_key)
+                self._aclient_loop = loop
+            response = await self._aclient.audio.transcriptions.create(
+                **self._request_kwargs(upload)
+            )
             return response.text.strip()
 
         except Exception:
+            if raise_errors:
+                raise
             self._logger.exception("OpenAI Whisper API transcription failed")
             return ""
+
+    async def aclose(self) -> None:
+        """Close the async client created by transcribe_bytes_async(), if any."""
+        client, self._aclient, self._aclient_loop = self._aclient, None, None
+        if client is not None:
+            await client.close()
+
+    def _request_kwargs(self, upload: AudioUpload) -> dict:
+        """Build the transcription request arguments for an encoded payload."""
+        kwargs = {"model": self.model, "file": upload}
+        if self.language:
+            kwargs["language"] = self.language
+        return kwargs
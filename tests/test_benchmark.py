@@ -0,0 +1,87 @@
+import asyncio
+import importlib.util
+import os
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from claude_stt.engines import whisper_api
+
+_BENCHMARK_PATH = Path(__file__).resolve().parent.parent / "scripts" / "benchmark.py"
+_spec = importlib.util.spec_from_file_location("benchmark", _BENCHMARK_PATH)
+benchmark = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(benchmark)
+
+
+def _write_wav(path: str, samples: np.ndarray, sample_rate: int = 16000) -> None:
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.astype("<i2").tobytes())
+
+
+class LoadAudioFilesTests(unittest.TestCase):
+    def test_load_audio_files_concatenates_in_order(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = os.path.join(temp_dir, "first.wav")
+            second = os.path.join(temp_dir, "second.wav")
+            _write_wav(first, np.arange(-100, 100, dtype=np.int16))
+            _write_wav(second, np.full(50, 12345, dtype=np.int16))
+
+            audio = asyncio.run(benchmark.load_audio_files([first, second]))
+
+            expected = np.concatenate(
+                [benchmark.load_audio_file(first), benchmark.load_audio_file(second)]
+            )
+            self.assertEqual(audio.dtype, np.float32)
+            np.testing.assert_array_equal(audio, expected)
+
+    def test_load_audio_file_async_matches_sync_loader(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "clip.wav")
+            _write_wav(path, np.array([0, 16384, -16384, 32767, -32768], dtype=np.int16))
+
+            audio = asyncio.run(benchmark.load_audio_file_async(path))
+
+            np.testing.assert_array_equal(audio, benchmark.load_audio_file(path))
+            np.testing.assert_array_equal(audio, [0.0, 0.5, -0.5, 32767 / 32768, -1.0])
+
+
+class BenchmarkEngineTests(unittest.TestCase):
+    @patch("claude_stt.engines.whisper_api._AsyncOpenAI")
+    @patch("claude_stt.engines.whisper_api._OpenAI")
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_failed_requests_excluded_but_empty_transcripts_kept(
+        self, mock_openai_class, mock_async_class
+    ):
+        whisper_api._client_cache.clear()
+        self.addCleanup(whisper_api._client_cache.clear)
+        mock_aclient = mock_async_class.return_value
+        mock_aclient.close = AsyncMock()
+        mock_aclient.audio.transcriptions.create = AsyncMock(
+            side_effect=[
+                RuntimeError("rate limited"),
+                MagicMock(text=""),
+                MagicMock(text="hello"),
+            ]
+        )
+        engine = whisper_api.WhisperAPIEngine(api_key="test-key")
+
+        result = benchmark.benchmark_engine(
+            engine, np.zeros(1600, dtype=np.float32), 16000, runs=3, concurrency=1
+        )
+
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["failed_runs"], 1)
+        self.assertEqual(len(result["transcribe_times"]), 2)
+        self.assertEqual(result["result"], "")
+        mock_aclient.close.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,9 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from claude_stt.config import Config
 
@@ -34,6 +39,51 @@ class ConfigTests(unittest.TestCase):
             config = Config(engine=engine).validate()
             self.assertEqual(config.engine, engine)
 
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict("os.environ", {"CLAUDE_STT_CONFIG_DIR": temp_dir}):
+                config = Config(
+                    mode="push-to-talk",
+                    engine="whisper-api",
+                    whisper_api_language="en",
+                    max_recording_seconds=60,
+                    sound_effects=False,
+                )
+                self.assertTrue(config.save())
+
+                loaded = Config.load()
+                self.assertEqual(loaded, config)
+
+    def test_load_fills_missing_keys_with_defaults(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict("os.environ", {"CLAUDE_STT_CONFIG_DIR": temp_dir}):
+                Config.get_config_path().write_text('[claude-stt]\nengine = "whisper"\n')
+
+                loaded = Config.load()
+                self.assertEqual(loaded.engine, "whisper")
+                self.assertEqual(loaded.hotkey, Config.hotkey)
+                self.assertEqual(loaded.max_recording_seconds, Config.max_recording_seconds)
+
+    def test_import_does_not_require_home_directory(self):
+        code = (
+            "import pathlib\n"
+            "def fail(cls):\n"
+            "    raise RuntimeError('no home')\n"
+            "pathlib.Path.home = classmethod(fail)\n"
+            "from claude_stt.config import Config\n"
+            "print(Config.get_config_path())\n"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env = dict(os.environ, CLAUDE_STT_CONFIG_DIR=temp_dir)
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=env,
+            ).stdout.strip()
+            self.assertEqual(output, os.path.join(temp_dir, "config.toml"))
+
 
 if __name__ == "__main__":
     unittest.main()
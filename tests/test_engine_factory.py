@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 
 from claude_stt.config import Config
@@ -42,6 +44,22 @@ class EngineFactoryTests(unittest.TestCase):
         engine = build_engine(config)
         self.assertIsNone(engine.language)
 
+    def test_import_does_not_load_engine_backends(self):
+        code = (
+            "import sys, claude_stt.engine_factory; "
+            "print(any(m in sys.modules for m in ("
+            "'claude_stt.engines.moonshine', "
+            "'claude_stt.engines.whisper', "
+            "'claude_stt.engines.whisper_api')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        self.assertEqual(output, "False")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,29 @@
 """Tests for the WhisperAPIEngine."""
 
+import asyncio
+import io
+import subprocess
+import sys
 import unittest
-from unittest.mock import MagicMock, patch
+import wave
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 
-from claude_stt.engines.whisper_api import WhisperAPIEngine, _openai_available
+from claude_stt.engines import whisper_api
+from claude_stt.engines.whisper_api import (
+    WhisperAPIEngine,
+    _openai_available,
+    _to_pcm16,
+    _wav_bytes,
+)
 
 
 class WhisperAPIEngineTests(unittest.TestCase):
+    def setUp(self):
+        whisper_api._client_cache.clear()
+        self.addCleanup(whisper_api._client_cache.clear)
+
     def test_not_available_without_api_key(self):
         """Engine should not be available without API key."""
         with patch.dict("os.environ", {}, clear=True):
@@ -85,6 +100,276 @@ class WhisperAPIEngineTests(unittest.TestCase):
         call_kwargs = mock_client.audio.transcriptions.create.call_args[1]
         self.assertEqual(call_kwargs["language"], "es")
 
+    @patch("claude_stt.engines.whisper_api._OpenAI")
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_client_shared_between_engines(self, mock_openai_class):
+        """Engines with the same API key should reuse one client."""
+        first = WhisperAPIEngine(api_key="test-key")
+        second = WhisperAPIEngine(api_key="test-key")
+        other = WhisperAPIEngine(api_key="other-key")
+
+        self.assertTrue(first.load_model())
+        self.assertTrue(second.load_model())
+        self.assertTrue(other.load_model())
+
+        self.assertIs(first._client, second._client)
+        self.assertEqual(mock_openai_class.call_count, 2)
+
+    @patch("claude_stt.engines.whisper_api._AsyncOpenAI")
+    @patch("claude_stt.engines.whisper_api._OpenAI")
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_transcribe_async_uses_async_client(self, mock_openai_class, mock_async_class):
+        """Async transcription should await the async client."""
+        mock_aclient = MagicMock()
+        mock_async_class.return_value = mock_aclient
+        mock_aclient.audio.transcriptions.create = AsyncMock(
+            return_value=MagicMock(text=" Hello async ")
+        )
+
+        engine = WhisperAPIEngine(api_key="test-key", language="en")
+        audio = np.zeros(16000, dtype=np.float32)
+
+        result = asyncio.run(engine.transcribe_async(audio, sample_rate=16000))
+
+        self.assertEqual(result, "Hello async")
+        call_kwargs = mock_aclient.audio.transcriptions.create.call_args[1]
+        self.assertEqual(call_kwargs["model"], "whisper-1")
+        self.assertEqual(call_kwargs["language"], "en")
+        mock_openai_class.return_value.audio.transcriptions.create.assert_not_called()
+
+    @patch("claude_stt.engines.whisper_api._AsyncOpenAI")
+    @patch("claude_stt.engines.whisper_api._OpenAI")
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_transcribe_bytes_async_raise_errors(self, mock_openai_class, mock_async_class):
+        """raise_errors should surface request failures instead of returning ""."""
+        mock_async_class.return_value.audio.transcriptions.create = AsyncMock(
+            side_effect=RuntimeError("rate limited")
+        )
+        engine = WhisperAPIEngine(api_key="test-key")
+        upload = ("audio.wav", b"RIFF", "audio/wav")
+
+        self.assertEqual(asyncio.run(engine.transcribe_bytes_async(upload)), "")
+        with self.assertRaises(RuntimeError):
+            asyncio.run(engine.transcribe_bytes_async(upload, raise_errors=True))
+
+    @patch("claude_stt.engines.whisper_api._AsyncOpenAI")
+    @patch("claude_stt.engines.whisper_api._OpenAI")
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_async_client_recreated_per_event_loop(self, mock_openai_class, mock_async_class):
+        """Each event loop should get its own async client."""
+        clients = []
+
+        def make_client(**kwargs):
+            client = MagicMock()
+            client.audio.transcriptions.create = AsyncMock(return_value=MagicMock(text="Hi"))
+            client.close = AsyncMock()
+            clients.append(client)
+            return client
+
+        mock_async_class.side_effect = make_client
+        engine = WhisperAPIEngine(api_key="test-key")
+        audio = np.zeros(16000, dtype=np.float32)
+
+        async def transcribe_twice():
+            first = await engine.transcribe_async(audio)
+            second = await engine.transcribe_async(audio)
+            return first, second
+
+        self.assertEqual(asyncio.run(transcribe_twice()), ("Hi", "Hi"))
+        self.assertEqual(len(clients), 1)
+
+        self.assertEqual(asyncio.run(engine.transcribe_async(audio)), "Hi")
+        self.assertEqual(len(clients), 2)
+
+        asyncio.run(engine.aclose())
+        clients[1].close.assert_awaited_once()
+        self.assertIsNone(engine._aclient)
+
+    @patch("claude_stt.engines.whisper_api._soundfile_available", False)
+    @patch("claude_stt.engines.whisper_api._sf", None)
+    @patch("claude_stt.engines.whisper_api._OpenAI")
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_transcribe_bytes_reuses_encoded_payload(self, mock_openai_class):
+        """Pre-encoded audio should be uploaded as-is."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.audio.transcriptions.create.return_value = MagicMock(text="Hello")
+
+        engine = WhisperAPIEngine(api_key="test-key")
+        upload = engine.encode_audio(np.zeros(16000, dtype=np.float32), sample_rate=16000)
+
+        self.assertEqual(engine.transcribe_bytes(upload), "Hello")
+        self.assertEqual(engine.transcribe_bytes(upload), "Hello")
+
+        call_kwargs = mock_client.audio.transcriptions.create.call_args[1]
+        self.assertIs(call_kwargs["file"], upload)
+        self.assertEqual(upload[0], "audio.wav")
+        self.assertEqual(upload[2], "audio/wav")
+
+    @patch("claude_stt.engines.whisper_api._OpenAI", None)
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_load_model_fails_when_sdk_import_fails(self):
+        """A broken openai install should be reported as unavailable."""
+        with patch.dict("sys.modules", {"openai": None}):
+            engine = WhisperAPIEngine(api_key="test-key")
+
+            self.assertFalse(engine.load_model())
+            self.assertFalse(engine.is_available())
+
+    @patch("claude_stt.engines.whisper_api._sf")
+    def test_encode_audio_prefers_flac(self, mock_sf):
+        """Float audio should be compressed when soundfile is installed."""
+        mock_sf.write.side_effect = lambda buffer, *args, **kwargs: buffer.write(b"fLaC-data")
+        engine = WhisperAPIEngine(api_key="test-key")
+
+        upload = engine.encode_audio(np.zeros(16000, dtype=np.float32), sample_rate=16000)
+
+        self.assertEqual(upload, ("audio.flac", b"fLaC-data", "audio/flac"))
+        self.assertEqual(mock_sf.write.call_args[1], {"format": "FLAC", "subtype": "PCM_16"})
+        written = mock_sf.write.call_args[0][1]
+        self.assertEqual(written.dtype, np.int16)
+        self.assertTrue(np.shares_memory(written, engine._pcm_scratch))
+
+    def test_import_does_not_load_optional_sdks(self):
+        """Importing the engine module should not import openai or soundfile."""
+        code = (
+            "import sys, claude_stt.engines.whisper_api; "
+            "print(any(m in sys.modules for m in ('openai', 'soundfile')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        self.assertEqual(output, "False")
+
+    @patch("claude_stt.engines.whisper_api._sf", None)
+    @patch("claude_stt.engines.whisper_api._soundfile_available", True)
+    def test_soundfile_import_failure_falls_back_to_wav(self):
+        """A broken soundfile install should be remembered and use WAV."""
+        engine = WhisperAPIEngine(api_key="test-key")
+
+        with patch.dict("sys.modules", {"soundfile": None}):
+            filename, data, _ = engine.encode_audio(
+                np.zeros(160, dtype=np.float32), sample_rate=16000
+            )
+
+            self.assertEqual(filename, "audio.wav")
+            self.assertEqual(data[:4], b"RIFF")
+            self.assertFalse(whisper_api._soundfile_available)
+
+    @patch("claude_stt.engines.whisper_api._sf")
+    def test_encode_audio_falls_back_to_wav(self, mock_sf):
+        """Encoding should fall back to WAV if FLAC encoding fails."""
+        mock_sf.write.side_effect = RuntimeError("format not supported")
+        engine = WhisperAPIEngine(api_key="test-key")
+
+        filename, data, content_type = engine.encode_audio(
+            np.zeros(16000, dtype=np.float32), sample_rate=16000
+        )
+
+        self.assertEqual((filename, content_type), ("audio.wav", "audio/wav"))
+        self.assertEqual(data[:4], b"RIFF")
+
+    @patch("claude_stt.engines.whisper_api._sf")
+    def test_encode_audio_without_compression(self, mock_sf):
+        """compress=False should always upload WAV."""
+        engine = WhisperAPIEngine(api_key="test-key", compress=False)
+
+        filename, data, _ = engine.encode_audio(
+            np.zeros(16000, dtype=np.float32), sample_rate=16000
+        )
+
+        self.assertEqual(filename, "audio.wav")
+        self.assertEqual(data[:4], b"RIFF")
+        mock_sf.write.assert_not_called()
+
+    @patch("claude_stt.engines.whisper_api._soundfile_available", False)
+    @patch("claude_stt.engines.whisper_api._sf", None)
+    def test_encode_audio_reuses_pcm_scratch(self):
+        """Repeated WAV encodes should reuse one int16 buffer."""
+        engine = WhisperAPIEngine(api_key="test-key")
+        long_audio = np.full(16000, 0.5, dtype=np.float32)
+        short_audio = np.full(8000, -0.5, dtype=np.float32)
+
+        _, long_data, _ = engine.encode_audio(long_audio, sample_rate=16000)
+        scratch = engine._pcm_scratch
+        _, short_data, _ = engine.encode_audio(short_audio, sample_rate=16000)
+
+        self.assertIs(engine._pcm_scratch, scratch)
+        self.assertEqual(long_data, _wav_bytes(_to_pcm16(long_audio), 16000))
+        self.assertEqual(short_data, _wav_bytes(_to_pcm16(short_audio), 16000))
+
+    def test_pcm16_conversion_scales_float_audio(self):
+        """Float audio should be rounded into the int16 range and clipped."""
+        audio = np.array(
+            [0.0, 0.5, -0.5, 0.3, -0.3, 1.0, -1.0, 1.5, -1.5, 1.5 / 32768],
+            dtype=np.float32,
+        )
+
+        pcm = _to_pcm16(audio)
+
+        self.assertEqual(pcm.dtype, np.int16)
+        np.testing.assert_array_equal(
+            pcm, [0, 16384, -16384, 9830, -9830, 32767, -32768, 32767, -32768, 2]
+        )
+
+    def test_pcm16_conversion_spans_blocks(self):
+        """Conversion should cover audio longer than one block."""
+        audio = np.linspace(-1.2, 1.2, whisper_api._PCM_BLOCK_SAMPLES * 2 + 123, dtype=np.float32)
+
+        pcm = _to_pcm16(audio)
+
+        expected = np.clip(np.rint(audio * np.float32(32768)), -32768, 32767).astype(np.int16)
+        np.testing.assert_array_equal(pcm, expected)
+
+    def test_pcm16_conversion_matches_soundfile(self):
+        """WAV samples should match what libsndfile writes to FLAC."""
+        try:
+            import soundfile
+        except (ImportError, OSError):
+            self.skipTest("soundfile not installed")
+
+        audio = np.random.default_rng(0).uniform(-1.5, 1.5, 16000).astype(np.float32)
+        buffer = io.BytesIO()
+        soundfile.write(buffer, audio, 16000, format="FLAC", subtype="PCM_16")
+        buffer.seek(0)
+        decoded, _ = soundfile.read(buffer, dtype="int16")
+
+        np.testing.assert_array_equal(_to_pcm16(audio), decoded)
+
+    def test_wav_bytes_readable_by_wave_module(self):
+        """Hand-built WAV header should describe the PCM payload."""
+        pcm = np.arange(-100, 100, dtype=np.int16)
+
+        data = _wav_bytes(pcm, 16000)
+
+        self.assertEqual(len(data), 44 + pcm.nbytes)
+        with wave.open(io.BytesIO(data), "rb") as wav_file:
+            self.assertEqual(wav_file.getnchannels(), 1)
+            self.assertEqual(wav_file.getsampwidth(), 2)
+            self.assertEqual(wav_file.getframerate(), 16000)
+            frames = wav_file.readframes(wav_file.getnframes())
+        np.testing.assert_array_equal(np.frombuffer(frames, dtype=np.int16), pcm)
+
+    @patch("claude_stt.engines.whisper_api._AsyncOpenAI")
+    @patch("claude_stt.engines.whisper_api._OpenAI")
+    @patch("claude_stt.engines.whisper_api._openai_available", True)
+    def test_transcribe_returns_empty_when_encoding_fails(
+        self, mock_openai_class, mock_async_class
+    ):
+        """Encoding errors should be logged and yield an empty transcript."""
+        engine = WhisperAPIEngine(api_key="test-key")
+        audio = np.zeros(16000, dtype=np.float32)
+
+        with patch.object(engine, "encode_audio", side_effect=ValueError("bad audio")):
+            self.assertEqual(engine.transcribe(audio), "")
+            self.assertEqual(asyncio.run(engine.transcribe_async(audio)), "")
+
+        mock_openai_class.return_value.audio.transcriptions.create.assert_not_called()
+        mock_async_class.assert_not_called()
+
     def test_transcribe_returns_empty_when_unavailable(self):
         """Transcribe should return empty string when engine unavailable."""
         with patch.dict("os.environ", {}, clear=True):